@@ -0,0 +1,55 @@
+"""
+Import-time benchmark.
+
+Each case runs in a fresh interpreter and reports the median wall time of
+the import statement over several runs, plus whether scikit-learn ended up
+in sys.modules.
+
+Run:
+    python benchmarks/bench_import_time.py [repeats]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+
+CASES = [
+    ("numpy", "import numpy"),
+    ("detectors (burst only)", "from signalguard_logs.detectors import LogBurstDetector"),
+    ("features (templates only)", "from signalguard_logs.features import LogTemplateExtractor"),
+    ("detectors + semantic", "from signalguard_logs.detectors import SemanticIForestDetector"),
+]
+
+SNIPPET = """
+import json, sys, time
+t = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t
+print(json.dumps({{"ms": elapsed * 1000, "sklearn": "sklearn" in sys.modules}}))
+"""
+
+
+def run_case(stmt: str):
+    out = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(stmt=stmt)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"=== Import time (median of {repeats} fresh interpreters) ===")
+    for label, stmt in CASES:
+        runs = [run_case(stmt) for _ in range(repeats)]
+        ms = statistics.median(r["ms"] for r in runs)
+        print(f"{label:>26}: {ms:8.1f} ms  sklearn loaded: {runs[-1]['sklearn']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Throughput benchmark for JsonLogParser.
+
+Compares lines/sec for:
+  - parse_lines (per-line json.loads into LogRecord objects)
+  - parse_batch with the stdlib decoder
+  - parse_batch with orjson, when installed
+
+Run:
+    python benchmarks/bench_json_parsing.py [n_lines]
+"""
+
+import json
+import random
+import sys
+import time
+
+from signalguard_logs.parsing import JsonLogParser
+from signalguard_logs.parsing import json_parser
+
+
+def generate_lines(n: int):
+    rng = random.Random(7)
+    now = time.time()
+    levels = ["info", "warn", "error"]
+    services = ["auth", "checkout", "payments"]
+    lines = []
+    for i in range(n):
+        lines.append(
+            json.dumps(
+                {
+                    "timestamp": now + i,
+                    "level": rng.choice(levels),
+                    "service": rng.choice(services),
+                    "message": f"Request {rng.randint(1, 10**6)} handled in {rng.randint(1, 500)} ms",
+                    "request_id": f"{rng.getrandbits(64):016x}",
+                    "user_id": rng.randint(1, 10**5),
+                    "path": "/api/v1/items",
+                }
+            )
+        )
+    return lines
+
+
+def bench(label: str, fn, lines):
+    start = time.perf_counter()
+    fn(lines)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>32}: {len(lines) / elapsed:12,.0f} lines/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = generate_lines(n)
+
+    print(f"=== JsonLogParser throughput ({n} lines) ===")
+    stdlib = JsonLogParser(accelerated=False)
+    bench("parse_lines (json)", lambda ls: list(stdlib.parse_lines(ls)), lines)
+    bench("parse_batch (json)", stdlib.parse_batch, lines)
+    bench(
+        "parse_batch (json, keys=request_id)",
+        lambda ls: stdlib.parse_batch(ls, keys=["request_id"]),
+        lines,
+    )
+
+    if json_parser.orjson is None:
+        print("orjson not installed; skipping accelerated path")
+        return
+
+    fast = JsonLogParser()
+    bench("parse_batch (orjson)", fast.parse_batch, lines)
+    bench(
+        "parse_batch (orjson, keys=request_id)",
+        lambda ls: fast.parse_batch(ls, keys=["request_id"]),
+        lines,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Per-format throughput benchmark for MultiFormatLogParser.
+
+Reports lines/sec for each built-in format on its own, for a bursty
+interleaved stream, and for RegexLogParser on the bracketed format as a
+reference.
+
+Run:
+    python benchmarks/bench_multi_format.py [n_lines]
+"""
+
+import random
+import sys
+import time
+
+from signalguard_logs.parsing import MultiFormatLogParser, RegexLogParser
+
+
+LEVELS = ["INFO", "WARN", "ERROR"]
+SERVICES = ["auth", "checkout", "payments"]
+
+
+def bracketed_line(rng: random.Random) -> str:
+    return (
+        f"[2025-11-23 12:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}] "
+        f"[{rng.choice(LEVELS)}] [{rng.choice(SERVICES)}] "
+        f"Request {rng.randint(1, 10**6)} handled in {rng.randint(1, 500)} ms"
+    )
+
+
+def iso_line(rng: random.Random) -> str:
+    return (
+        f"2025-11-23T12:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.123 "
+        f"{rng.choice(LEVELS)} {rng.choice(SERVICES)}: "
+        f"Cache miss for key {rng.getrandbits(32):08x}"
+    )
+
+
+def garbage_line(rng: random.Random) -> str:
+    return f"   at com.example.Worker.run(Worker.java:{rng.randint(1, 999)})"
+
+
+GENERATORS = {"bracketed": bracketed_line, "iso": iso_line, "unmatched": garbage_line}
+
+
+def generate(kind: str, n: int):
+    rng = random.Random(7)
+    return [GENERATORS[kind](rng) for _ in range(n)]
+
+
+def generate_bursty(n: int, burst: int = 50):
+    rng = random.Random(7)
+    kinds = list(GENERATORS)
+    lines = []
+    while len(lines) < n:
+        gen = GENERATORS[rng.choice(kinds)]
+        lines.extend(gen(rng) for _ in range(rng.randint(1, burst)))
+    return lines[:n]
+
+
+def bench(label: str, parser, lines):
+    start = time.perf_counter()
+    for _ in parser.parse_lines(lines):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {len(lines) / elapsed:12,.0f} lines/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"=== MultiFormatLogParser throughput ({n} lines) ===")
+    for kind in GENERATORS:
+        bench(f"multi-format, {kind}", MultiFormatLogParser(), generate(kind, n))
+
+    bursty = generate_bursty(n)
+    parser = MultiFormatLogParser()
+    bench("multi-format, interleaved", parser, bursty)
+    print(f"{'unmatched lines':>28}: {parser.unmatched.get('', 0)}")
+
+    bench("RegexLogParser, bracketed", RegexLogParser(), generate("bracketed", n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Serial vs parallel LogTemplateExtractor.extract_ids.
+
+Run:
+    python benchmarks/bench_parallel_templates.py [n_messages] [n_jobs]
+"""
+
+import os
+import random
+import sys
+import time
+
+from signalguard_logs.features import LogTemplateExtractor
+
+
+def generate_messages(n: int):
+    rng = random.Random(7)
+    patterns = [
+        "Request {} handled in {} ms by worker {}",
+        "Cache miss for key {} on shard {} after {} retries",
+        "User {} failed login from {} attempt {}",
+        "Timeout calling dependency {} for order {} at step {}",
+    ]
+    return [
+        rng.choice(patterns).format(
+            rng.randint(1, 10**7), f"{rng.getrandbits(40):010x}", rng.randint(1, 99)
+        )
+        for _ in range(n)
+    ]
+
+
+def bench(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>20}: {elapsed:8.2f} s")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    messages = generate_messages(n)
+
+    print(f"=== Template extraction ({n} messages, n_jobs={n_jobs}) ===")
+    serial = bench("serial", lambda: LogTemplateExtractor().extract_ids(messages))
+    parallel = bench(
+        f"parallel ({n_jobs} jobs)",
+        lambda: LogTemplateExtractor().extract_ids(messages, n_jobs=n_jobs),
+    )
+    assert serial == parallel, "parallel IDs differ from serial IDs"
+
+
+if __name__ == "__main__":
+    main()
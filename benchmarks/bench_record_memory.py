@@ -0,0 +1,86 @@
+"""
+Memory benchmark: bytes per record for LogRecord vs CompactLogRecord.
+
+Builds the same synthetic records as RegexLogParser would (no extra fields,
+repeated level / service values) three ways:
+
+  - LogRecord without interning (parser behaviour before)
+  - LogRecord with interned level / service
+  - CompactLogRecord with interned level / service
+
+and reports the traced allocation per record plus to_dict() throughput.
+
+Run:
+    python benchmarks/bench_record_memory.py [n_records]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from signalguard_logs.models import LogRecord, CompactLogRecord
+
+
+LEVELS = ["INFO", "WARN", "ERROR", "DEBUG"]
+SERVICES = ["auth", "checkout", "payments", "search", "gateway"]
+
+
+def generate_fields(n: int):
+    rng = random.Random(7)
+    now = time.time()
+    rows = []
+    for i in range(n):
+        level = rng.choice(LEVELS)
+        service = rng.choice(SERVICES)
+        msg = f"Request {rng.randint(1, 10**6)} handled in {rng.randint(1, 500)} ms"
+        rows.append((now + i, level, msg, service))
+    return rows
+
+
+def measure(record_cls, rows, intern):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # level.lower().upper() hands each record its own string copy, as a
+    # parser slicing regex groups or decoding JSON would.
+    records = [
+        record_cls(ts, intern(level.lower().upper()), msg, intern(service.upper().lower()))
+        for ts, level, msg, service in rows
+    ]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for r in records:
+        r.to_dict()
+    to_dict_s = time.perf_counter() - start
+
+    return (after - before) / len(records), to_dict_s, records
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = generate_fields(n)
+
+    print(f"=== LogRecord memory benchmark ({n} records) ===")
+    cases = [
+        ("LogRecord", LogRecord, str),
+        ("LogRecord + intern", LogRecord, sys.intern),
+        ("CompactLogRecord + intern", CompactLogRecord, sys.intern),
+    ]
+    results = {}
+    for label, record_cls, intern in cases:
+        per_record, to_dict_s, records = measure(record_cls, rows, intern)
+        results[label] = per_record
+        print(
+            f"{label:>26}: {per_record:8.1f} bytes/record "
+            f"(excluding message text), to_dict {n / to_dict_s:,.0f} rec/s"
+        )
+        del records
+
+    before, after = results["LogRecord"], results["CompactLogRecord + intern"]
+    print(f"Saved: {before - after:.1f} bytes/record ({(before - after) / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
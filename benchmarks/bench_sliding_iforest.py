@@ -0,0 +1,97 @@
+"""
+Sliding-window detection vs full IsolationForest retraining on a drifting stream.
+
+The stream is a sequence of windows of log messages. The set of normal
+templates shifts every few windows, and ~1% of each window are messages
+from a small pool of rare error templates built from words normal traffic
+never uses. Each window is passed to SemanticIForestDetector.detect, end to
+end, with no vectorizer fitted in advance:
+
+  - tfidf:     SemanticIForestDetector(), TF-IDF + 200 tree refit per window
+  - templates: SemanticIForestDetector(use_templates=True), 200 tree refit
+  - sliding:   SemanticIForestDetector(sliding=True), one detector for the
+               whole stream, a few new trees per window
+
+and we report detect() latency, ROC AUC of the returned scores on each
+window, and the number of trees held.
+
+Run:
+    python benchmarks/bench_sliding_iforest.py [n_windows] [window_size]
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+from signalguard_logs.detectors import SemanticIForestDetector
+from signalguard_logs.models import LogRecord, LogStream
+
+
+def build_templates(rng: random.Random):
+    words = [f"w{i}" for i in range(60)]
+    normal = [" ".join(rng.sample(words[:40], 5)) + " <NUM>" for _ in range(40)]
+    rare = [" ".join(rng.sample(words[40:], 5)) + " <NUM>" for _ in range(8)]
+    return normal, rare
+
+
+def generate_window(rng: random.Random, normal, rare, w: int, size: int, anomaly_rate: float = 0.01):
+    # the active template set moves by 4 templates every 3 windows
+    start = (w // 3) * 4 % len(normal)
+    active = [normal[(start + k) % len(normal)] for k in range(10)]
+    records, labels = [], []
+    for i in range(size):
+        if rng.random() < anomaly_rate:
+            tmpl = rng.choice(rare)
+            labels.append(1)
+        else:
+            tmpl = rng.choice(active)
+            labels.append(0)
+        msg = tmpl.replace("<NUM>", str(rng.randint(1, 10**6)))
+        records.append(LogRecord(timestamp=float(w * size + i), level="INFO", message=msg))
+    return LogStream(records), np.array(labels)
+
+
+def main():
+    n_windows = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    window_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    rng = random.Random(7)
+    normal, rare = build_templates(rng)
+    windows = [generate_window(rng, normal, rare, w, window_size) for w in range(n_windows)]
+
+    cases = [
+        ("tfidf", lambda: SemanticIForestDetector()),
+        ("templates", lambda: SemanticIForestDetector(use_templates=True)),
+        ("sliding", None),
+    ]
+    sliding = SemanticIForestDetector(sliding=True)
+
+    print(f"=== Sliding IsolationForest vs full retrain ({n_windows} windows x {window_size} logs) ===")
+    mean_latency = {}
+    for name, make_detector in cases:
+        latency, auc = [], []
+        for stream, labels in windows:
+            det = sliding if make_detector is None else make_detector()
+            start = time.perf_counter()
+            _, scores = det.detect(stream)
+            latency.append(time.perf_counter() - start)
+            if labels.any():
+                auc.append(roc_auc_score(labels, scores))
+
+        trees = sliding.ensemble.n_estimators if make_detector is None else det.iforest.n_estimators
+        mean_latency[name] = np.mean(latency)
+        print(
+            f"{name:>10}: detect mean {mean_latency[name] * 1000:8.1f} ms, "
+            f"AUC mean {np.mean(auc):.3f} (min {np.min(auc):.3f}, first window {auc[0]:.3f}), "
+            f"trees {trees}"
+        )
+
+    for name in ("tfidf", "templates"):
+        print(f"Sliding detect cost: {mean_latency['sliding'] / mean_latency[name]:.1%} of {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,29 @@
+from __future__ import annotations
+
+import importlib
+
+from .base import BaseLogDetector
 from .burst import LogBurstDetector
 from .new_template import NewTemplateDetector
-from .semantic_iforest import SemanticIForestDetector
+
+# Detectors backed by scikit-learn are imported on first attribute access,
+# so using only the lightweight detectors does not pay for importing sklearn.
+_LAZY_ATTRS = {
+    "SemanticIForestDetector": ".semantic_iforest",
+    "SlidingIForestEnsemble": ".sliding_iforest",
+}
+
+__all__ = ["BaseLogDetector", "LogBurstDetector", "NewTemplateDetector", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -6,8 +6,9 @@ import numpy as np
 from sklearn.ensemble import IsolationForest
 
 from ..models import LogStream
-from ..features import TFIDFVectorizer
+from ..features import TFIDFVectorizer, TemplateVectorizer
 from .base import BaseLogDetector
+from .sliding_iforest import SlidingIForestEnsemble
 
 
 class SemanticIForestDetector(BaseLogDetector):
@@ -22,18 +23,55 @@ class SemanticIForestDetector(BaseLogDetector):
     Parameters
     ----------
     max_features : int
-        Maximum TF-IDF features.
+        Maximum TF-IDF features. Unused when use_templates=True.
     contamination : float
         Expected fraction of anomalies.
+    use_templates : bool
+        Vectorize log templates instead of raw messages. Each message is
+        mapped to a template ID and its features are gathered from a sparse
+        matrix with one cached row per template, so vectorization cost
+        scales with the number of unique templates. Features are hashed
+        n-grams, so templates first seen on later calls still get
+        informative features and cached rows never change.
+    sliding : bool
+        Treat each detect() call as a window of a stream. Instead of a full
+        200 tree refit, a small forest is trained on a subsample of the
+        window and added to a SlidingIForestEnsemble that drops its oldest
+        forest after max_windows windows. Implies use_templates=True, whose
+        feature columns are only ever appended, so forests from earlier
+        windows can keep scoring later windows.
+    trees_per_window : int
+        Trees grown per window in sliding mode.
+    max_windows : int
+        Window forests kept in sliding mode.
     """
 
-    def __init__(self, max_features: int = 5000, contamination: float = 0.05):
-        self.vectorizer = TFIDFVectorizer(max_features=max_features)
+    def __init__(
+        self,
+        max_features: int = 5000,
+        contamination: float = 0.05,
+        use_templates: bool = False,
+        sliding: bool = False,
+        trees_per_window: int = 20,
+        max_windows: int = 10,
+    ):
+        use_templates = use_templates or sliding
+        self.use_templates = use_templates
+        self.sliding = sliding
+        if use_templates:
+            self.vectorizer = TemplateVectorizer()
+        else:
+            self.vectorizer = TFIDFVectorizer(max_features=max_features)
         self.iforest = IsolationForest(
             n_estimators=200,
             contamination=contamination,
             random_state=42,
         )
+        self.ensemble = SlidingIForestEnsemble(
+            trees_per_window=trees_per_window,
+            max_windows=max_windows,
+            random_state=42,
+        )
 
     def detect(self, stream: LogStream) -> Tuple[np.ndarray, np.ndarray]:
         messages = stream.messages()
@@ -41,10 +79,17 @@ class SemanticIForestDetector(BaseLogDetector):
         if n == 0:
             return np.zeros(0, dtype=int), np.zeros(0, dtype=float)
 
-        X = self.vectorizer.fit_transform(messages)
-        self.iforest.fit(X)
+        if self.use_templates:
+            X = self.vectorizer.transform(messages)
+        else:
+            X = self.vectorizer.fit_transform(messages)
+        if self.sliding:
+            self.ensemble.partial_fit(X)
+            decision_scores = self.ensemble.score_samples(X)
+        else:
+            self.iforest.fit(X)
+            decision_scores = self.iforest.decision_function(X)
 
-        decision_scores = self.iforest.decision_function(X)
         raw_scores = -decision_scores
         raw_scores = raw_scores - raw_scores.min()
         norm_scores = raw_scores / (raw_scores.max() + 1e-8)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Optional
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+
+class SlidingIForestEnsemble:
+    """
+    Isolation forest ensemble refreshed over sliding windows.
+
+    Every call to partial_fit() trains a small forest (trees_per_window
+    trees) on a subsample of the current window and appends it to the
+    ensemble. Once max_windows forests are held, the oldest one is dropped,
+    so the model follows drift while memory stays bounded by
+    trees_per_window * max_windows trees.
+
+    Scores are the mean of the member forests' score_samples(), so, as in
+    scikit-learn, higher means more normal.
+
+    X may gain columns between windows, as long as columns are only
+    appended (see TemplateVectorizer): each forest scores the leading
+    columns it was trained on, where later columns were all zero.
+
+    Parameters
+    ----------
+    trees_per_window : int
+        Trees grown per window.
+    max_windows : int
+        Number of window forests kept.
+    max_samples : int
+        Samples per tree, as in IsolationForest.
+    window_sample_size : int
+        Rows drawn from a window to train its forest. Larger windows are
+        subsampled so refit cost does not grow with window size.
+    random_state : int
+        Seed for subsampling and tree growth.
+    """
+
+    def __init__(
+        self,
+        trees_per_window: int = 20,
+        max_windows: int = 10,
+        max_samples: int = 256,
+        window_sample_size: int = 4096,
+        random_state: int = 42,
+    ):
+        self.trees_per_window = trees_per_window
+        self.max_windows = max_windows
+        self.max_samples = max_samples
+        self.window_sample_size = window_sample_size
+        self.random_state = random_state
+        self.forests: Deque[IsolationForest] = deque(maxlen=max_windows)
+        self._rng = np.random.default_rng(random_state)
+        self._n_windows = 0
+
+    @property
+    def n_estimators(self) -> int:
+        return sum(len(f.estimators_) for f in self.forests)
+
+    def partial_fit(self, X: np.ndarray, window_sample_size: Optional[int] = None) -> "SlidingIForestEnsemble":
+        n = X.shape[0]
+        if n == 0:
+            return self
+        size = window_sample_size or self.window_sample_size
+        if n > size:
+            X = X[self._rng.choice(n, size=size, replace=False)]
+
+        forest = IsolationForest(
+            n_estimators=self.trees_per_window,
+            max_samples=min(self.max_samples, X.shape[0]),
+            contamination="auto",
+            random_state=self.random_state + self._n_windows,
+        )
+        forest.fit(X)
+        self.forests.append(forest)
+        self._n_windows += 1
+        return self
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        if not self.forests:
+            raise RuntimeError("SlidingIForestEnsemble not fitted")
+        scores = np.zeros(X.shape[0], dtype=float)
+        for forest in self.forests:
+            scores += forest.score_samples(X[:, :forest.n_features_in_])
+        return scores / len(self.forests)
@@ -1,2 +1,26 @@
+from __future__ import annotations
+
+import importlib
+
 from .templates import LogTemplateExtractor
-from .text_vectorizer import TFIDFVectorizer
+
+# Vectorizers depend on scikit-learn and are imported on first attribute access.
+_LAZY_ATTRS = {
+    "TFIDFVectorizer": ".text_vectorizer",
+    "TemplateVectorizer": ".template_vectors",
+}
+
+__all__ = ["LogTemplateExtractor", *_LAZY_ATTRS]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
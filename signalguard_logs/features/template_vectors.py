@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from .templates import LogTemplateExtractor
+
+
+class TemplateVectorizer:
+    """
+    Hashed n-gram features computed per log template instead of per message.
+
+    Each message is mapped to a template ID by LogTemplateExtractor. Every
+    template is vectorized once and cached as a row of a sparse matrix
+    indexed by ID, so a message's features are a gather from that matrix.
+    Later calls only vectorize templates that were not seen before.
+
+    Features come from a HashingVectorizer, so they do not depend on which
+    templates were seen first: templates that appear after drift get
+    informative rows, and cached rows never change. Masked tokens (<NUM>,
+    <HEX>, <ID>) keep variable values out of the features; they are
+    tokenized whole, so they never collide with the words num, hex or id.
+    Single character tokens are kept as well.
+
+    Only hashed columns used by some template are kept, numbered in the
+    order they first appear. New templates can only append columns, so a
+    model fitted when there were n_columns columns can score later output
+    restricted to X[:, :n_columns]. The matrix always has at least one
+    column, even if no template produced a token yet.
+    """
+
+    # mask tokens like <num> (after lowercasing) first, then plain words
+    TOKEN_PATTERN = r"(?u)<\w+>|\w+"
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range=(1, 2), max_token_len: int = 30):
+        self.extractor = LogTemplateExtractor(max_token_len=max_token_len)
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            token_pattern=self.TOKEN_PATTERN,
+            alternate_sign=False,
+            norm="l2",
+        )
+        self._columns: Dict[int, int] = {}
+        self._matrix: Optional[sp.csr_matrix] = None
+
+    @property
+    def n_templates(self) -> int:
+        return 0 if self._matrix is None else self._matrix.shape[0]
+
+    @property
+    def n_columns(self) -> int:
+        return len(self._columns)
+
+    @property
+    def template_matrix(self) -> Optional[sp.csr_matrix]:
+        return self._matrix
+
+    def transform_ids(self, messages: List[str]) -> np.ndarray:
+        """Template IDs of messages, vectorizing new templates as needed."""
+        ids = np.asarray(self.extractor.extract_ids(messages), dtype=np.intp)
+        self._update_matrix()
+        return ids
+
+    def transform(self, messages: List[str]) -> sp.csr_matrix:
+        """Sparse feature rows of messages, one per message."""
+        ids = self.transform_ids(messages)
+        return self._matrix[ids]
+
+    def _update_matrix(self):
+        templates = self.extractor.templates
+        n_cached = self.n_templates
+        if n_cached == len(templates):
+            return
+
+        new_rows = self.hasher.transform(templates[n_cached:]).tocsr()
+        columns = self._columns
+        indices = []
+        for h in new_rows.indices.tolist():
+            col = columns.get(h)
+            if col is None:
+                col = columns[h] = len(columns)
+            indices.append(col)
+        # an all-zero column until some template yields a token
+        width = max(len(columns), 1)
+        new_rows = sp.csr_matrix(
+            (new_rows.data, np.asarray(indices, dtype=new_rows.indices.dtype), new_rows.indptr),
+            shape=(new_rows.shape[0], width),
+        )
+
+        if self._matrix is None:
+            self._matrix = new_rows
+        else:
+            # widen without resizing in place: callers may hold the old matrix
+            old = self._matrix
+            old = sp.csr_matrix((old.data, old.indices, old.indptr), shape=(n_cached, width))
+            # sparse stacking copies only the non-zeros, a few per template
+            self._matrix = sp.vstack([old, new_rows], format="csr")
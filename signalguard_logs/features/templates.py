@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
-from typing import List, Tuple, Dict
+from array import array
+from typing import List, Optional, Tuple, Dict
 
 
 class LogTemplateExtractor:
@@ -14,13 +16,27 @@ class LogTemplateExtractor:
       - Optionally mask tokens that look like IDs (length > max_token_len)
 
     This is not a full Drain implementation, but good enough for AIOps demos.
+
+    extract_ids() additionally assigns each distinct template a stable integer
+    ID (its index in `templates`), kept across calls.
+
+    extract_batch() and extract_ids() accept n_jobs to template the unique
+    messages of large batches in a process pool. Each worker gets at least
+    PARALLEL_MIN_SHARD unique messages, so fewer workers are used for
+    smaller batches and batches under 2 * PARALLEL_MIN_SHARD stay serial.
+    At ~5 us per message, a minimum shard is ~100 ms of work, well above
+    the cost of starting a worker and shipping its shard.
     """
 
+    PARALLEL_MIN_SHARD = 20_000
+
     NUM_RE = re.compile(r"^\d+(\.\d+)?$")
     HEX_RE = re.compile(r"^[0-9a-fA-F]{6,}$")
 
     def __init__(self, max_token_len: int = 30):
         self.max_token_len = max_token_len
+        self.templates: List[str] = []
+        self._template_ids: Dict[str, int] = {}
 
     def to_template(self, message: str) -> str:
         tokens = message.split()
@@ -36,8 +52,69 @@ class LogTemplateExtractor:
                 templ_tokens.append(tok)
         return " ".join(templ_tokens)
 
-    def extract_batch(self, messages: List[str]) -> List[str]:
-        return [self.to_template(m) for m in messages]
+    def extract_batch(self, messages: List[str], n_jobs: Optional[int] = 1) -> List[str]:
+        if n_jobs == 1:
+            return [self.to_template(m) for m in messages]
+        unique = list(dict.fromkeys(messages))
+        lookup = dict(zip(unique, self._unique_templates(unique, n_jobs)))
+        return [lookup[m] for m in messages]
+
+    def template_id(self, template: str) -> int:
+        tid = self._template_ids.get(template)
+        if tid is None:
+            tid = self._template_ids[template] = len(self.templates)
+            self.templates.append(template)
+        return tid
+
+    def extract_ids(self, messages: List[str], n_jobs: Optional[int] = 1) -> List[int]:
+        """
+        Template IDs of messages, in order.
+
+        n_jobs > 1 (or None / -1 for all cores) templates unique messages
+        in a process pool when there are enough of them; see
+        PARALLEL_MIN_SHARD.
+        """
+        if n_jobs != 1:
+            unique = list(dict.fromkeys(messages))
+            templates = self._unique_templates(unique, n_jobs)
+            # unique keeps first-occurrence order, so IDs match the serial path
+            lookup = {m: self.template_id(t) for m, t in zip(unique, templates)}
+            return [lookup[m] for m in messages]
+
+        # repeated messages are templated once
+        seen: Dict[str, int] = {}
+        ids = []
+        for m in messages:
+            tid = seen.get(m)
+            if tid is None:
+                tid = seen[m] = self.template_id(self.to_template(m))
+            ids.append(tid)
+        return ids
+
+    def _unique_templates(self, unique: List[str], n_jobs: Optional[int]) -> List[str]:
+        """Templates of already deduplicated messages, in order. Does not assign IDs."""
+        n_workers = min(_resolve_n_jobs(n_jobs), len(unique) // self.PARALLEL_MIN_SHARD)
+        if n_workers < 2:
+            return [self.to_template(m) for m in unique]
+
+        # One contiguous shard per worker, sent as a single string blob plus
+        # message lengths rather than a list of str objects.
+        shard_size = -(-len(unique) // n_workers)
+        shards = []
+        for start in range(0, len(unique), shard_size):
+            chunk = unique[start:start + shard_size]
+            shards.append(("".join(chunk), array("q", map(len, chunk)), self.max_token_len))
+
+        # imported here: pulls in multiprocessing, only needed for large batches
+        from concurrent.futures import ProcessPoolExecutor
+
+        templates: List[str] = []
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            # map() yields shard results in submission order
+            for blob, lengths, local_ids in pool.map(_template_shard, shards):
+                local = _split_blob(blob, lengths)
+                templates.extend(local[i] for i in local_ids)
+        return templates
 
     def count_templates(self, messages: List[str]) -> Dict[str, int]:
         templates = self.extract_batch(messages)
@@ -45,3 +122,32 @@ class LogTemplateExtractor:
         for t in templates:
             counts[t] = counts.get(t, 0) + 1
         return counts
+
+
+def _resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    return max(1, n_jobs)
+
+
+def _split_blob(blob: str, lengths: array) -> List[str]:
+    out = []
+    pos = 0
+    for n in lengths:
+        out.append(blob[pos:pos + n])
+        pos += n
+    return out
+
+
+def _template_shard(shard: Tuple[str, array, int]) -> Tuple[str, array, array]:
+    """
+    Process pool worker: template one shard of unique messages.
+
+    Returns the shard's distinct templates (blob + lengths) and, per message,
+    the index of its template in that local list.
+    """
+    blob, lengths, max_token_len = shard
+    extractor = LogTemplateExtractor(max_token_len=max_token_len)
+    local_ids = array("q", extractor.extract_ids(_split_blob(blob, lengths)))
+    templates = extractor.templates
+    return "".join(templates), array("q", map(len, templates)), local_ids
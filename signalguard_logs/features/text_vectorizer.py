@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer as SklearnTFIDF
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer as SklearnTFIDF
 
 
 class TFIDFVectorizer:
     """
     Thin wrapper around scikit-learn TF-IDF for log messages.
+
+    scikit-learn is imported on the first fit().
     """
 
     def __init__(self, max_features: int = 5000, ngram_range=(1, 2)):
@@ -17,6 +21,8 @@ class TFIDFVectorizer:
         self._vec: SklearnTFIDF | None = None
 
     def fit(self, messages: List[str]):
+        from sklearn.feature_extraction.text import TfidfVectorizer as SklearnTFIDF
+
         self._vec = SklearnTFIDF(
             max_features=self.max_features,
             ngram_range=self.ngram_range,
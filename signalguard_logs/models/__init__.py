@@ -1,2 +1,2 @@
-from .record import LogRecord
+from .record import LogRecord, CompactLogRecord
 from .stream import LogStream
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+# Shared read-only mapping used by records without extra fields, so the
+# common case does not pay for a fresh dict per record.
+EMPTY_EXTRA: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass
@@ -40,6 +46,89 @@ class LogRecord:
             "message": self.message,
             "service": self.service,
         }
-        d.update(self.extra)
+        if self.extra:
+            d.update(self.extra)
         return d
 
+
+class CompactLogRecord:
+    """
+    Memory efficient variant of LogRecord.
+
+    Same attributes as LogRecord, but stored in __slots__ instead of a
+    per-instance __dict__. `extra` is always a read-only mapping: records
+    without extra fields share EMPTY_EXTRA, others get a read-only copy of
+    the mapping they were built with. Use to_record() for a mutable copy.
+
+    Level and service are stored as given. The parsers intern them, so
+    millions of parsed records reference a handful of string objects.
+
+    Use it for large list-of-records workloads; LogStream and the detectors
+    only rely on attribute access and accept either type.
+    """
+
+    __slots__ = ("timestamp", "level", "message", "service", "extra")
+
+    def __init__(
+        self,
+        timestamp: float,
+        level: str,
+        message: str,
+        service: str = "",
+        extra: Optional[Mapping[str, Any]] = None,
+    ):
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+        self.service = service
+        self.extra = MappingProxyType(dict(extra)) if extra else EMPTY_EXTRA
+
+    def __reduce__(self):
+        # mappingproxy cannot be pickled; EMPTY_EXTRA is restored by __init__
+        extra = dict(self.extra) if self.extra else None
+        return (CompactLogRecord, (self.timestamp, self.level, self.message, self.service, extra))
+
+    def to_dict(self) -> Dict[str, Any]:
+        extra = self.extra
+        if extra is EMPTY_EXTRA:
+            return {
+                "timestamp": self.timestamp,
+                "level": self.level,
+                "message": self.message,
+                "service": self.service,
+            }
+        return {
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "message": self.message,
+            "service": self.service,
+            **extra,
+        }
+
+    def to_record(self) -> LogRecord:
+        return LogRecord(
+            timestamp=self.timestamp,
+            level=self.level,
+            message=self.message,
+            service=self.service,
+            extra=dict(self.extra),
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (CompactLogRecord, LogRecord)):
+            return NotImplemented
+        return (
+            self.timestamp == other.timestamp
+            and self.level == other.level
+            and self.message == other.message
+            and self.service == other.service
+            and dict(self.extra) == dict(other.extra)
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactLogRecord(timestamp={self.timestamp!r}, level={self.level!r}, "
+            f"message={self.message!r}, service={self.service!r}, extra={dict(self.extra)!r})"
+        )
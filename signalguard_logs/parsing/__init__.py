@@ -1,2 +1,3 @@
 from .regex_parser import RegexLogParser
 from .json_parser import JsonLogParser
+from .multi_format import LogFormat, MultiFormatLogParser
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..models import LogRecord, CompactLogRecord
+
+
+@dataclass
+class LogFormat:
+    """
+    One plain text log format understood by MultiFormatLogParser.
+
+    Attributes
+    ----------
+    name : str
+        Format name, used as key in per-format counters.
+    pattern : str
+        Regex with named groups timestamp, level, service and optionally
+        message. It is applied with re.match, so it is anchored at the start
+        of the line. If there is no message group, the rest of the line after
+        the match is the message, which avoids a trailing ".*" capture.
+    prefixes : tuple of str
+        Literal prefixes every matching line starts with. Used as a cheap
+        reject before the regex and to dispatch on the first character.
+        No prefixes (or only empty ones) means the format is tried for
+        every line.
+    time_format : str, optional
+        strptime format for the timestamp group, or None for ISO 8601.
+    """
+
+    name: str
+    pattern: str
+    prefixes: Tuple[str, ...] = ()
+    time_format: Optional[str] = None
+    regex: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.prefixes = tuple(p for p in self.prefixes if p)
+        self.regex = re.compile(self.pattern)
+
+
+BRACKETED_FORMAT = LogFormat(
+    name="bracketed",
+    pattern=r"\[(?P<timestamp>[^\]]+)\]\s+\[(?P<level>[^\]]+)\]\s+\[(?P<service>[^\]]*)\]\s+",
+    prefixes=("[",),
+    time_format="%Y-%m-%d %H:%M:%S",
+)
+
+ISO_FORMAT = LogFormat(
+    name="iso",
+    pattern=(
+        r"(?P<timestamp>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\s+"
+        r"(?P<level>[A-Za-z]+)\s+(?P<service>[\w.\-]+):\s+"
+    ),
+    prefixes=tuple("0123456789"),
+)
+
+DEFAULT_FORMATS = (BRACKETED_FORMAT, ISO_FORMAT)
+
+# Splits ISO 8601 timestamps so they can be rewritten into the subset
+# datetime.fromisoformat accepts on Python < 3.11: 6 fraction digits and a
+# "+HH:MM" offset.
+_ISO_PARTS = re.compile(
+    r"(?P<base>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})(?:\.(?P<frac>\d+))?"
+    r"(?:(?P<utc>Z)|(?P<sign>[+-])(?P<hh>\d{2}):?(?P<mm>\d{2}))?$"
+)
+
+
+def _parse_iso(ts_str: str) -> float:
+    m = _ISO_PARTS.match(ts_str)
+    if m is None:
+        return dt.datetime.fromisoformat(ts_str).timestamp()
+    text = m.group("base")
+    frac = m.group("frac")
+    if frac:
+        text += "." + frac[:6].ljust(6, "0")
+    if m.group("utc"):
+        text += "+00:00"
+    elif m.group("sign"):
+        text += f"{m.group('sign')}{m.group('hh')}:{m.group('mm')}"
+    return dt.datetime.fromisoformat(text).timestamp()
+
+
+class MultiFormatLogParser:
+    """
+    Parse plain text logs where several formats are interleaved.
+
+    For each line:
+      - the format that last matched for the same source is tried first,
+        since formats tend to come in bursts;
+      - otherwise only formats whose literal prefix fits the first character
+        of the line are tried, in declaration order.
+
+    Lines matching no format are not turned into records. They are counted
+    per source in `unmatched` instead.
+
+    Parameters
+    ----------
+    formats : sequence of LogFormat, optional
+        Formats to try. Defaults to DEFAULT_FORMATS.
+    compact : bool
+        Emit CompactLogRecord instead of LogRecord.
+    """
+
+    def __init__(self, formats: Optional[Sequence[LogFormat]] = None, compact: bool = False):
+        self.formats: List[LogFormat] = list(formats or DEFAULT_FORMATS)
+        self.compact = compact
+
+        # first character -> candidate formats, prefix-less formats appended
+        any_prefix = [f for f in self.formats if not f.prefixes]
+        self._dispatch: Dict[str, List[LogFormat]] = {}
+        for fmt in self.formats:
+            for p in fmt.prefixes:
+                candidates = self._dispatch.setdefault(p[0], [])
+                if fmt not in candidates:
+                    candidates.append(fmt)
+        for candidates in self._dispatch.values():
+            candidates.sort(key=self.formats.index)
+            candidates.extend(any_prefix)
+        self._fallback = any_prefix
+
+        self._last_format: Dict[str, LogFormat] = {}
+        self._level_cache: Dict[str, str] = {}
+        self.unmatched: Dict[str, int] = {}
+        self.format_counts: Dict[str, int] = {f.name: 0 for f in self.formats}
+
+    def _match(self, line: str, source: str):
+        last = self._last_format.get(source)
+        if last is not None and (not last.prefixes or line.startswith(last.prefixes)):
+            m = last.regex.match(line)
+            if m:
+                return last, m
+
+        for fmt in self._dispatch.get(line[:1], self._fallback):
+            if fmt is last:
+                continue
+            if fmt.prefixes and not line.startswith(fmt.prefixes):
+                continue
+            m = fmt.regex.match(line)
+            if m:
+                self._last_format[source] = fmt
+                return fmt, m
+        return None, None
+
+    def parse_lines(self, lines: Iterable[str], source: str = "") -> Iterator[LogRecord]:
+        record_cls = CompactLogRecord if self.compact else LogRecord
+        level_cache = self._level_cache
+        format_counts = self.format_counts
+        unmatched = 0
+        # consecutive lines often share a second-resolution timestamp
+        last_ts_key: Tuple[Optional[str], Optional[str]] = (None, None)
+        last_ts = 0.0
+
+        try:
+            for line in lines:
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+                fmt, m = self._match(line, source)
+                if fmt is None:
+                    unmatched += 1
+                    continue
+                format_counts[fmt.name] += 1
+
+                groups = m.groupdict()
+                message = groups.get("message")
+                if message is None:
+                    message = line[m.end():]
+
+                raw_level = groups.get("level") or "INFO"
+                level = level_cache.get(raw_level)
+                if level is None:
+                    level = level_cache[raw_level] = sys.intern(raw_level.upper())
+
+                ts_key = (groups.get("timestamp"), fmt.time_format)
+                if ts_key != last_ts_key or ts_key[0] is None:
+                    last_ts_key = ts_key
+                    last_ts = self._parse_timestamp(*ts_key)
+
+                yield record_cls(
+                    timestamp=last_ts,
+                    level=level,
+                    message=message,
+                    service=sys.intern(groups.get("service") or ""),
+                )
+        finally:
+            if unmatched:
+                self.unmatched[source] = self.unmatched.get(source, 0) + unmatched
+
+    @staticmethod
+    def _parse_timestamp(ts_str: Optional[str], time_format: Optional[str]) -> float:
+        try:
+            if time_format is None:
+                return _parse_iso(ts_str)
+            return time.mktime(time.strptime(ts_str, time_format))
+        except Exception:
+            return time.time()
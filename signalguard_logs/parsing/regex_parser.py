@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import re
+import sys
 import time
 from typing import Iterable, Iterator, Optional
 
-from ..models import LogRecord
+from ..models import LogRecord, CompactLogRecord
 
 
 class RegexLogParser:
@@ -16,23 +17,28 @@ class RegexLogParser:
 
     You can pass a custom pattern with named groups:
       timestamp, level, service, message
+
+    Level and service values are interned. Set compact=True to emit
+    CompactLogRecord instead of LogRecord for large batches.
     """
 
     DEFAULT_PATTERN = (
         r"^\[(?P<timestamp>[^\]]+)\]\s+\[(?P<level>[^\]]+)\]\s+\[(?P<service>[^\]]*)\]\s+(?P<message>.*)$"
     )
 
-    def __init__(self, pattern: Optional[str] = None, time_format: str = "%Y-%m-%d %H:%M:%S"):
+    def __init__(self, pattern: Optional[str] = None, time_format: str = "%Y-%m-%d %H:%M:%S", compact: bool = False):
         self.pattern = re.compile(pattern or self.DEFAULT_PATTERN)
         self.time_format = time_format
+        self.compact = compact
 
     def parse_lines(self, lines: Iterable[str]) -> Iterator[LogRecord]:
+        record_cls = CompactLogRecord if self.compact else LogRecord
         for line in lines:
             line = line.rstrip("\n")
             m = self.pattern.match(line)
             if not m:
                 # Fallback: treat whole line as message with current timestamp
-                yield LogRecord(
+                yield record_cls(
                     timestamp=time.time(),
                     level="INFO",
                     message=line,
@@ -50,9 +56,9 @@ class RegexLogParser:
             service = m.group("service") or ""
             message = m.group("message") or ""
 
-            yield LogRecord(
+            yield record_cls(
                 timestamp=ts,
-                level=level.upper(),
+                level=sys.intern(level.upper()),
                 message=message,
-                service=service,
+                service=sys.intern(service),
             )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from ..models import LogStream
+
+
+class BaseRecipe(ABC):
+    """
+    Base class for high-level log recipes.
+
+    run() returns a dict with at least:
+      - labels: np.ndarray of shape (n,), values in {0, 1}
+      - scores: np.ndarray of shape (n,), higher = more anomalous
+    """
+
+    @abstractmethod
+    def run(self, stream: LogStream) -> Dict[str, Any]:
+        raise NotImplementedError
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from ..models import LogStream
-from ..detectors import LogBurstDetector, SemanticIForestDetector
+from ..detectors import LogBurstDetector
 from .base import BaseRecipe
 
 
@@ -55,7 +55,10 @@ class CombinedLogHealthRecipe(BaseRecipe):
                 burst_labels_global[i] = l
                 burst_scores_global[i] = s
 
-        # Semantic anomalies across all logs
+        # Semantic anomalies across all logs. Imported here so that importing
+        # the recipes package does not load scikit-learn.
+        from ..detectors import SemanticIForestDetector
+
         sem_det = SemanticIForestDetector(contamination=self.semantic_contamination)
         sem_labels, sem_scores = sem_det.detect(stream)
 
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "stmt",
+    [
+        "import signalguard_logs.detectors; from signalguard_logs.detectors import LogBurstDetector",
+        "from signalguard_logs.features import LogTemplateExtractor",
+        "from signalguard_logs.recipes import ErrorBurstRecipe, CombinedLogHealthRecipe",
+    ],
+)
+def test_light_imports_do_not_load_sklearn(stmt):
+    code = f"import sys; {stmt}; sys.exit('sklearn' in sys.modules)"
+    repo_root = Path(__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=repo_root)
+    assert result.returncode == 0, result.stderr or "sklearn was imported"
+
+
+def test_lazy_attributes_resolve():
+    import signalguard_logs.detectors as detectors
+    import signalguard_logs.features as features
+
+    assert detectors.SemanticIForestDetector.__name__ == "SemanticIForestDetector"
+    assert features.TemplateVectorizer.__name__ == "TemplateVectorizer"
+    assert "SlidingIForestEnsemble" in dir(detectors)
+    with pytest.raises(AttributeError):
+        detectors.NoSuchDetector
@@ -0,0 +1,93 @@
+import math
+import time
+
+import pytest
+
+from signalguard_logs.parsing import JsonLogParser
+from signalguard_logs.parsing import json_parser
+
+
+LINES = [
+    '{"timestamp": 10, "level": "warn", "message": "slow", "service": "api", "user_id": 1}\n',
+    '{"timestamp": "2025-11-23T12:34:56", "level": "error", "message": 5, "service": "db"}',
+    "",
+    "   ",
+    "[1, 2]",
+    "not json",
+    '{"v": NaN, "message": "nan"}',
+    '{"v": 1e400, "message": "big"}',
+]
+
+
+def parse(accelerated, lines=LINES, **kwargs):
+    return JsonLogParser(accelerated=accelerated).parse_batch(lines, **kwargs)
+
+
+def drop_timestamps(columns):
+    return {k: v for k, v in columns.items() if k != "timestamp"}
+
+
+def test_stdlib_output():
+    columns = parse(False, keys=["user_id", "v"])
+
+    assert columns["level"] == ["WARN", "ERROR", "INFO", "INFO", "INFO", "INFO"]
+    assert columns["message"] == ["slow", "5", "[1, 2]", "not json", "nan", "big"]
+    assert columns["service"] == ["api", "db", "", "", "", ""]
+    assert columns["user_id"] == [1, None, None, None, None, None]
+    assert math.isnan(columns["v"][4])
+    assert columns["v"][5] == math.inf
+    assert columns["timestamp"][0] == 10.0
+
+
+def test_orjson_matches_stdlib():
+    pytest.importorskip("orjson")
+    fast_parser = JsonLogParser(accelerated=True)
+    assert fast_parser.decoder == "orjson"
+
+    fast = fast_parser.parse_batch(LINES, keys=["user_id", "v"])
+    slow = parse(False, keys=["user_id", "v"])
+
+    assert fast["timestamp"][:2] == slow["timestamp"][:2]
+    fast_rest, slow_rest = drop_timestamps(fast), drop_timestamps(slow)
+    nan_fast, nan_slow = fast_rest["v"].pop(4), slow_rest["v"].pop(4)
+    assert math.isnan(nan_fast) and math.isnan(nan_slow)
+    assert fast_rest == slow_rest
+
+
+def test_stdlib_when_orjson_missing(monkeypatch):
+    monkeypatch.setattr(json_parser, "orjson", None)
+    assert JsonLogParser().decoder == "json"
+
+
+@pytest.mark.parametrize("keys", [["level"], ["timestamp"], ["a", "a"]])
+def test_invalid_keys(keys):
+    with pytest.raises(ValueError):
+        JsonLogParser().parse_batch([], keys=keys)
+
+
+@pytest.mark.parametrize("accelerated", [False, True])
+def test_missing_and_null_fields(accelerated):
+    before = time.time()
+    columns = parse(
+        accelerated,
+        [
+            '{"message": "missing"}',
+            '{"message": "null", "level": null, "service": null, "timestamp": null}',
+        ],
+        keys=["request_id"],
+    )
+    after = time.time()
+
+    assert columns["level"] == ["INFO", "NONE"]
+    assert columns["service"] == ["", "None"]
+    assert columns["request_id"] == [None, None]
+    # fallback timestamp is taken once per chunk
+    assert columns["timestamp"][0] == columns["timestamp"][1]
+    assert before <= columns["timestamp"][0] <= after
+
+
+def test_fallback_timestamp_per_chunk():
+    columns = JsonLogParser().parse_batch(['{"message": "a"}'] * 3, batch_size=2)
+
+    assert len(columns["timestamp"]) == 3
+    assert columns["timestamp"][0] == columns["timestamp"][1]
@@ -0,0 +1,106 @@
+import datetime as dt
+
+import pytest
+
+from signalguard_logs.parsing import LogFormat, MultiFormatLogParser
+from signalguard_logs.parsing.multi_format import BRACKETED_FORMAT, ISO_FORMAT
+
+
+BRACKETED = "[2025-11-23 12:34:56] [error] [payments] Card declined"
+ISO = "2025-11-23T12:34:56 WARN auth: Token expired"
+
+
+def utc(*args, micro=0, offset_minutes=0):
+    tz = dt.timezone(dt.timedelta(minutes=offset_minutes))
+    return dt.datetime(*args, microsecond=micro, tzinfo=tz).timestamp()
+
+
+def test_first_character_dispatch():
+    parser = MultiFormatLogParser()
+
+    assert parser._dispatch["["] == [BRACKETED_FORMAT]
+    assert parser._dispatch["2"] == [ISO_FORMAT]
+    assert "x" not in parser._dispatch
+
+
+def test_prefix_rejects_before_regex():
+    # the regex alone would match, but the line does not start with the prefix
+    fmt = LogFormat(name="tagged", pattern=r"@?(?P<level>\w+) (?P<service>\w+) ", prefixes=("@",))
+    parser = MultiFormatLogParser([fmt])
+
+    assert list(parser.parse_lines(["INFO api hello"], source="h")) == []
+    assert parser.unmatched == {"h": 1}
+    assert [r.message for r in parser.parse_lines(["@INFO api hello"], source="h")] == ["hello"]
+    assert parser.unmatched == {"h": 1}
+
+
+def test_interleaved_formats_and_per_source_cache():
+    parser = MultiFormatLogParser()
+
+    a = list(parser.parse_lines([BRACKETED, ISO, BRACKETED], source="a"))
+    b = list(parser.parse_lines([ISO], source="b"))
+
+    assert [(r.level, r.service, r.message) for r in a] == [
+        ("ERROR", "payments", "Card declined"),
+        ("WARN", "auth", "Token expired"),
+        ("ERROR", "payments", "Card declined"),
+    ]
+    assert b[0].message == "Token expired"
+    assert parser._last_format == {"a": BRACKETED_FORMAT, "b": ISO_FORMAT}
+    assert parser.format_counts == {"bracketed": 2, "iso": 2}
+
+
+def test_unmatched_counted_per_source():
+    parser = MultiFormatLogParser()
+
+    list(parser.parse_lines(["junk", BRACKETED, "  at Worker.run()"], source="a"))
+    list(parser.parse_lines(["junk"], source="b"))
+
+    assert parser.unmatched == {"a": 2, "b": 1}
+    assert parser.format_counts == {"bracketed": 1, "iso": 0}
+
+
+def test_unmatched_counted_when_generator_closed_early():
+    parser = MultiFormatLogParser()
+
+    gen = parser.parse_lines(["junk", "junk", BRACKETED, "junk", ISO], source="h")
+    assert next(gen).service == "payments"
+    gen.close()
+
+    assert parser.unmatched == {"h": 2}
+
+
+@pytest.mark.parametrize(
+    "ts, expected",
+    [
+        ("2025-11-23T12:34:56Z", utc(2025, 11, 23, 12, 34, 56)),
+        ("2025-11-23T12:34:56.000Z", utc(2025, 11, 23, 12, 34, 56)),
+        ("2025-11-23T12:34:56+02:00", utc(2025, 11, 23, 12, 34, 56, offset_minutes=120)),
+        ("2025-11-23T12:34:56-0530", utc(2025, 11, 23, 12, 34, 56, offset_minutes=-330)),
+        ("2025-11-23T12:34:56.12Z", utc(2025, 11, 23, 12, 34, 56, micro=120000)),
+        ("2025-11-23 12:34:56.1234567+0000", utc(2025, 11, 23, 12, 34, 56, micro=123456)),
+        ("2025-11-23T12:34:56.5", dt.datetime(2025, 11, 23, 12, 34, 56, 500000).timestamp()),
+    ],
+)
+def test_iso_timestamp_variants(ts, expected):
+    parser = MultiFormatLogParser()
+    records = list(parser.parse_lines([f"{ts} INFO api: hello"]))
+
+    assert len(records) == 1
+    assert records[0].timestamp == pytest.approx(expected)
+    assert records[0].message == "hello"
+
+
+def test_empty_prefix_format_tried_for_every_line():
+    fmt = LogFormat(
+        name="any",
+        pattern=r"(?P<timestamp>\S+) (?P<level>\w+) (?P<service>\w+) ",
+        prefixes=("",),
+    )
+    assert fmt.prefixes == ()
+
+    parser = MultiFormatLogParser([fmt])
+    records = list(parser.parse_lines(["2025-11-23T12:34:56 INFO api hello", "x DEBUG web hi"]))
+
+    assert [r.message for r in records] == ["hello", "hi"]
+    assert parser.format_counts == {"any": 2}
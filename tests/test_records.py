@@ -0,0 +1,64 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from signalguard_logs.models import CompactLogRecord, LogRecord
+from signalguard_logs.models.record import EMPTY_EXTRA
+from signalguard_logs.parsing import JsonLogParser, RegexLogParser
+
+
+def test_compact_to_dict_matches_log_record():
+    plain = CompactLogRecord(1.0, "INFO", "hello", "api")
+    extra = CompactLogRecord(1.0, "INFO", "hello", "api", {"user_id": 7})
+
+    assert plain.to_dict() == LogRecord(1.0, "INFO", "hello", "api").to_dict()
+    assert extra.to_dict() == LogRecord(1.0, "INFO", "hello", "api", {"user_id": 7}).to_dict()
+
+
+def test_compact_equals_log_record():
+    assert CompactLogRecord(1.0, "INFO", "m", "s", {"a": 1}) == LogRecord(1.0, "INFO", "m", "s", {"a": 1})
+    assert LogRecord(1.0, "INFO", "m", "s") == CompactLogRecord(1.0, "INFO", "m", "s")
+    assert CompactLogRecord(1.0, "INFO", "m", "s") != CompactLogRecord(1.0, "ERROR", "m", "s")
+
+
+def test_compact_extra_is_read_only_copy():
+    extra = {"a": 1}
+    rec = CompactLogRecord(1.0, "INFO", "m", "s", extra)
+    extra["b"] = 2
+
+    assert dict(rec.extra) == {"a": 1}
+    with pytest.raises(TypeError):
+        rec.extra["c"] = 3
+    assert CompactLogRecord(1.0, "INFO", "m").extra is EMPTY_EXTRA
+
+
+@pytest.mark.parametrize("extra", [None, {"a": 1}])
+def test_compact_pickle_and_deepcopy_round_trip(extra):
+    rec = CompactLogRecord(1.0, "INFO", "m", "s", extra)
+
+    for clone in (pickle.loads(pickle.dumps(rec)), copy.deepcopy(rec), copy.copy(rec)):
+        assert clone == rec
+        assert isinstance(clone, CompactLogRecord)
+    assert (pickle.loads(pickle.dumps(rec)).extra is EMPTY_EXTRA) == (extra is None)
+
+
+def test_regex_parser_compact():
+    line = "[2025-11-23 12:34:56] [error] [payments] Card declined"
+    records = list(RegexLogParser(compact=True).parse_lines([line]))
+
+    assert len(records) == 1
+    rec = records[0]
+    assert isinstance(rec, CompactLogRecord)
+    assert (rec.level, rec.service, rec.message) == ("ERROR", "payments", "Card declined")
+    assert rec == next(RegexLogParser().parse_lines([line]))
+
+
+def test_json_parser_compact():
+    line = json.dumps({"timestamp": 5, "level": "warn", "message": "slow", "service": "api", "user_id": 3})
+    rec = next(JsonLogParser(compact=True).parse_lines([line]))
+
+    assert isinstance(rec, CompactLogRecord)
+    assert rec.to_dict() == {"timestamp": 5.0, "level": "WARN", "message": "slow", "service": "api", "user_id": 3}
+    assert rec == next(JsonLogParser().parse_lines([line]))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from signalguard_logs.detectors import SemanticIForestDetector, SlidingIForestEnsemble
+from signalguard_logs.models import LogRecord, LogStream
+
+
+def test_ensemble_keeps_at_most_max_windows():
+    rng = np.random.default_rng(0)
+    ensemble = SlidingIForestEnsemble(trees_per_window=5, max_windows=3)
+
+    for _ in range(5):
+        ensemble.partial_fit(rng.normal(size=(200, 4)))
+
+    assert len(ensemble.forests) == 3
+    assert ensemble.n_estimators == 5 * 3
+
+
+def test_score_samples_before_fit():
+    with pytest.raises(RuntimeError):
+        SlidingIForestEnsemble().score_samples(np.zeros((2, 3)))
+
+
+def test_older_forests_score_wider_input():
+    rng = np.random.default_rng(0)
+    ensemble = SlidingIForestEnsemble(trees_per_window=5, max_windows=3)
+    ensemble.partial_fit(rng.normal(size=(200, 2)))
+    ensemble.partial_fit(rng.normal(size=(200, 4)))
+
+    X = rng.normal(size=(10, 4))
+    scores = ensemble.score_samples(X)
+
+    assert [f.n_features_in_ for f in ensemble.forests] == [2, 4]
+    expected = (ensemble.forests[0].score_samples(X[:, :2]) + ensemble.forests[1].score_samples(X)) / 2
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_sliding_detector_scores_in_unit_range():
+    det = SemanticIForestDetector(sliding=True, trees_per_window=5, max_windows=2)
+    rng = np.random.default_rng(0)
+    words = ["login", "logout", "timeout", "cache", "miss", "disk", "full", "retry"]
+
+    for window in range(4):
+        records = [
+            LogRecord(
+                timestamp=float(i),
+                level="INFO",
+                message=f"{rng.choice(words)} {rng.choice(words)} {rng.integers(1000)}",
+            )
+            for i in range(100)
+        ]
+        labels, scores = det.detect(LogStream(records))
+
+        assert scores.shape == (100,)
+        assert labels.shape == (100,)
+        assert scores.min() >= 0.0 and scores.max() <= 1.0
+
+    assert len(det.ensemble.forests) == 2
@@ -1 +1,109 @@
-# TODO: simple tests for template extraction
+import numpy as np
+
+from signalguard_logs.features import LogTemplateExtractor, TemplateVectorizer
+
+
+def test_to_template_masks_numbers_and_hex():
+    extractor = LogTemplateExtractor()
+    assert extractor.to_template("Timeout 3001 on connection abc123ffffffff") == "Timeout <NUM> on connection <HEX>"
+
+
+def test_extract_ids_stable_across_calls():
+    extractor = LogTemplateExtractor()
+    first = extractor.extract_ids(["user 1 login", "disk ff00ff00 full", "user 2 login"])
+    second = extractor.extract_ids(["disk abcdef12 full", "cache miss", "user 3 login"])
+
+    assert first == [0, 1, 0]
+    assert second == [1, 2, 0]
+    assert extractor.templates == ["user <NUM> login", "disk <HEX> full", "cache miss"]
+
+
+def test_template_vectorizer_first_call():
+    vectorizer = TemplateVectorizer()
+    X = vectorizer.transform(["user 1 login", "user 2 login", "disk full"])
+
+    assert X.shape == (3, vectorizer.n_columns)
+    assert vectorizer.n_templates == 2
+    assert (X[0] != X[1]).nnz == 0
+    assert (X[0] != X[2]).nnz > 0
+
+
+def test_template_vectorizer_novel_templates_are_distinct():
+    vectorizer = TemplateVectorizer()
+    vectorizer.transform(["user 1 login", "disk full"])
+    n_columns = vectorizer.n_columns
+    X = vectorizer.transform(["totally novel words here", "another unseen event"])
+
+    assert vectorizer.n_templates == 4
+    assert vectorizer.n_columns > n_columns
+    # novel templates only use the appended columns
+    assert X[:, :n_columns].nnz == 0
+    assert X[0].nnz > 1 and X[1].nnz > 1
+    assert (X[0] != X[1]).nnz > 0
+    # cached rows are not changed by later calls
+    np.testing.assert_array_equal(
+        vectorizer.transform(["user 7 login"]).toarray(),
+        vectorizer.template_matrix[0].toarray(),
+    )
+
+
+MESSAGES = [
+    "user 1 login",
+    "Zugriff verweigert für Benutzer 42",
+    "disk ff00ff00 full",
+    "user 2 login",
+    "キャッシュ ミス 7",
+    "Zugriff verweigert für Benutzer 43",
+    "cache miss",
+    "user 1 login",
+] * 5
+
+
+def test_parallel_extract_ids_matches_serial(monkeypatch):
+    monkeypatch.setattr(LogTemplateExtractor, "PARALLEL_MIN_SHARD", 2)
+    serial = LogTemplateExtractor()
+    parallel = LogTemplateExtractor()
+
+    assert parallel.extract_ids(MESSAGES, n_jobs=3) == serial.extract_ids(MESSAGES)
+    assert parallel.templates == serial.templates
+    # a second call keeps IDs consistent with the first
+    assert parallel.extract_ids(["cache miss", "new event"], n_jobs=3) == serial.extract_ids(["cache miss", "new event"])
+
+
+def test_parallel_extract_batch_matches_serial_without_assigning_ids(monkeypatch):
+    monkeypatch.setattr(LogTemplateExtractor, "PARALLEL_MIN_SHARD", 2)
+    extractor = LogTemplateExtractor()
+
+    assert extractor.extract_batch(MESSAGES, n_jobs=3) == extractor.extract_batch(MESSAGES)
+    assert extractor.extract_batch(["a 1"], n_jobs=2) == ["a <NUM>"]
+    assert extractor.templates == []
+
+
+def test_template_vectorizer_masks_and_short_tokens():
+    vectorizer = TemplateVectorizer()
+    X = vectorizer.transform(["user 5", "user num", "x"])
+
+    # "<NUM>" and the word "num" are different features
+    assert (X[0] != X[1]).nnz > 0
+    # single character tokens are kept
+    assert X[2].nnz > 0
+
+
+def test_template_vectorizer_without_tokens_has_one_column():
+    vectorizer = TemplateVectorizer()
+    X = vectorizer.transform(["...", "--"])
+
+    assert X.shape == (2, 1)
+    assert X.nnz == 0
+
+
+def test_template_matrix_not_resized_in_place():
+    vectorizer = TemplateVectorizer()
+    vectorizer.transform(["user 1 login"])
+    before = vectorizer.template_matrix
+    shape = before.shape
+
+    vectorizer.transform(["disk full"])
+
+    assert before.shape == shape
+    assert vectorizer.template_matrix.shape[1] > shape[1]